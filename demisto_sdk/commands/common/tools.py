@@ -1355,13 +1355,13 @@ def get_content_path() -> str:
     return ''
 
 
-def run_command_os(command: str, cwd: Union[Path, str], env: Union[os._Environ, dict] = os.environ) -> \
+def run_command_os(command: str, cwd: Union[Path, str], env: Optional[Union[os._Environ, dict]] = None) -> \
         Tuple[str, str, int]:
     """ Run command in subprocess tty
     Args:
         command(str): Command to be executed.
         cwd(Path): Path from pathlib object to be executed
-        env: Environment variables for the execution
+        env: Environment variables for the execution, the current process environment is inherited if not given
     Returns:
         str: Stdout of the command
         str: Stderr of the command
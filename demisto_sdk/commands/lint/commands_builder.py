@@ -20,6 +20,59 @@ from demisto_sdk.commands.lint.resources.pylint_plugins.xsoar_level_checker impo
 # Local imports
 
 excluded_files = ["CommonServerPython.py", "demistomock.py", "CommonServerUserPython.py", "conftest.py", "venv"]
+# Excluded files as passed to the linters - file1,file2,file3,..
+EXCLUDED_FILES_CSV = ','.join(excluded_files)
+
+# Bandit arguments which are the same for all packages
+BANDIT_ARGS = (
+    # Reporting only issues with high and medium severity level
+    " -ll"
+    # Reporting only issues of a high confidence level
+    " -iii"
+    # Skip the following tests: Pickle usage, Use of insecure hash func, Audit url open,
+    # Using xml.etree.ElementTree.fromstring,  Using xml.dom.minidom.parseString
+    " -s B301,B303,B310,B314,B318"
+    # Aggregate output by filename
+    " -a file"
+    # File to be excluded when performing lints check
+    f" --exclude={EXCLUDED_FILES_CSV}"
+    # Only show output in the case of an error
+    " -q"
+    # Setting error format
+    " --format custom --msg-template '{abspath}:{line}: {test_id} "
+    "[Severity: {severity} Confidence: {confidence}] {msg}'"
+)
+
+# Mypy arguments which are the same for all packages
+MYPY_ARGS = (
+    # This flag enable type checks the body of every function, regardless of whether it has type annotations.
+    " --check-untyped-defs"
+    # This flag makes mypy ignore all missing imports.
+    " --ignore-missing-imports"
+    # This flag adjusts how mypy follows imported modules that were not explicitly passed in via the command line
+    " --follow-imports=silent"
+    # This flag will add column offsets to error messages.
+    " --show-column-numbers"
+    # This flag will precede all errors with “note” messages explaining the context of the error.
+    " --show-error-codes"
+    # Use visually nicer output in error messages
+    " --pretty"
+    # This flag enables redefinion of a variable with an arbitrary type in some contexts.
+    " --allow-redefinition"
+    # Get the full path to the file.
+    " --show-absolute-path"
+)
+
+# Pylint arguments which are the same for all packages, following the disabled messages
+PYLINT_ARGS = (
+    # Disable specific errors
+    " -d duplicate-string-formatting-argument"
+    # Message format
+    " --msg-template='{abspath}:{line}:{column}: {msg_id} {obj}: {msg}'"
+    # List of members which are set dynamically and missed by pylint inference system, and so shouldn't trigger
+    # E1101 when accessed.
+    " --generated-members=requests.packages.urllib3,requests.codes.ok"
+)
 
 
 def get_python_exec(py_num: str, is_py2: bool = False) -> str:
@@ -54,13 +107,10 @@ def build_flake8_command(files: List[Path], py_num: str) -> str:
     Returns:
         str: flake8 command
     """
+    # Generating file patterns - path1 path2 path3 ..
+    files_list = ' '.join(str(file) for file in files)
 
-    command = f"{get_python_exec(py_num)} -m flake8"
-    # Generating file patterns - path1,path2,path3,..
-    files_list = [str(file) for file in files]
-    command += ' ' + ' '.join(files_list)
-
-    return command
+    return f"{get_python_exec(py_num)} -m flake8 {files_list}"
 
 
 def build_bandit_command(files: List[Path]) -> str:
@@ -72,28 +122,10 @@ def build_bandit_command(files: List[Path]) -> str:
     Returns:
         str: bandit command
     """
-    command = "python3 -m bandit"
-    # Reporting only issues with high and medium severity level
-    command += " -ll"
-    # Reporting only issues of a high confidence level
-    command += " -iii"
-    # Skip the following tests: Pickle usage, Use of insecure hash func, Audit url open,
-    # Using xml.etree.ElementTree.fromstring,  Using xml.dom.minidom.parseString
-    command += " -s B301,B303,B310,B314,B318"
-    # Aggregate output by filename
-    command += " -a file"
-    # File to be excluded when performing lints check
-    command += f" --exclude={','.join(excluded_files)}"
-    # Only show output in the case of an error
-    command += " -q"
-    # Setting error format
-    command += " --format custom --msg-template '{abspath}:{line}: {test_id} " \
-               "[Severity: {severity} Confidence: {confidence}] {msg}'"
     # Generating path patterns - path1,path2,path3,..
-    files_list = [str(item) for item in files]
-    command += f" -r {','.join(files_list)}"
+    files_list = ','.join(str(item) for item in files)
 
-    return command
+    return f"python3 -m bandit{BANDIT_ARGS} -r {files_list}"
 
 
 def build_xsoar_linter_command(files: List[Path], py_num: str, support_level: str = "base") -> str:
@@ -138,7 +170,7 @@ def build_xsoar_linter_command(files: List[Path], py_num: str, support_level: st
 
     command = f"{get_python_exec(py_num, True)} -m pylint"
     # Excluded files
-    command += f" --ignore={','.join(excluded_files)}"
+    command += f" --ignore={EXCLUDED_FILES_CSV}"
     # Disable all errors
     command += " -E --disable=all"
     # Message format
@@ -165,25 +197,8 @@ def build_mypy_command(files: List[Path], version: str, content_repo: Path = Non
     Returns:
         str: mypy command
     """
-    command = "python3 -m mypy"
     # Define python versions
-    command += f" --python-version {version}"
-    # This flag enable type checks the body of every function, regardless of whether it has type annotations.
-    command += " --check-untyped-defs"
-    # This flag makes mypy ignore all missing imports.
-    command += " --ignore-missing-imports"
-    # This flag adjusts how mypy follows imported modules that were not explicitly passed in via the command line
-    command += " --follow-imports=silent"
-    # This flag will add column offsets to error messages.
-    command += " --show-column-numbers"
-    # This flag will precede all errors with “note” messages explaining the context of the error.
-    command += " --show-error-codes"
-    # Use visually nicer output in error messages
-    command += " --pretty"
-    # This flag enables redefinion of a variable with an arbitrary type in some contexts.
-    command += " --allow-redefinition"
-    # Get the full path to the file.
-    command += " --show-absolute-path"
+    command = f"python3 -m mypy --python-version {version}{MYPY_ARGS}"
     # Point cache to be .mypy_cache in the content repo
     command += f" --cache-dir={content_repo/'.mypy_cache' if content_repo else '/dev/null'}"
     # Generating path patterns - file1 file2 file3,..
@@ -208,7 +223,7 @@ def build_vulture_command(files: List[Path], pack_path: Path, py_num: str) -> st
     # Excluded files
     command += f" --min-confidence {os.environ.get('VULTURE_MIN_CONFIDENCE_LEVEL', '100')}"
     # File to be excluded when performing lints check
-    command += f" --exclude={','.join(excluded_files)}"
+    command += f" --exclude={EXCLUDED_FILES_CSV}"
     # Whitelist vulture
     whitelist = Path(pack_path) / '.vulture_whitelist.py'
     if whitelist.exists():
@@ -229,7 +244,7 @@ def build_pylint_command(files: List[Path], docker_version: Optional[str] = None
     """
     command = "python -m pylint"
     # Excluded files
-    command += f" --ignore={','.join(excluded_files)}"
+    command += f" --ignore={EXCLUDED_FILES_CSV}"
     # Prints only errors
     command += " -E"
     # disable xsoar linter messages
@@ -243,14 +258,7 @@ def build_pylint_command(files: List[Path], docker_version: Optional[str] = None
 
         if major == 3 and minor >= 9:
             disable.append('unsubscriptable-object')
-    command += f" --disable={','.join(disable)}"
-    # Disable specific errors
-    command += " -d duplicate-string-formatting-argument"
-    # Message format
-    command += " --msg-template='{abspath}:{line}:{column}: {msg_id} {obj}: {msg}'"
-    # List of members which are set dynamically and missed by pylint inference system, and so shouldn't trigger
-    # E1101 when accessed.
-    command += " --generated-members=requests.packages.urllib3,requests.codes.ok"
+    command += f" --disable={','.join(disable)}{PYLINT_ARGS}"
     # Generating path patterns - file1 file2 file3,..
     files_list = [file.name for file in files]
     command += " " + " ".join(files_list)
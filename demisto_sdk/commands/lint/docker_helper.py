@@ -1,7 +1,9 @@
+import io
 import logging
 import os
 import tarfile
 import tempfile
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -11,26 +13,35 @@ from docker.types import Mount
 from demisto_sdk.commands.common.constants import TYPE_PYTHON
 
 DOCKER_CLIENT = None
+DOCKER_CLIENT_LOCK = threading.Lock()
+# Docker hub login status of the shared client, set once when the client is created
+DOCKER_HUB_LOGIN: Optional[bool] = None
 logger = logging.getLogger('demisto-sdk')
 PATH_OR_STR = Union[Path, str]
 # this will be used to determine if the system supports mounts
 CAN_MOUNT_FILES = not os.getenv('CIRCLECI', False)
+INSTALLATION_SCRIPTS_DIR = Path(__file__).parent / 'resources' / 'installation_scripts'
 
 
 def init_global_docker_client(timeout: int = 60, log_prompt: str = ''):
 
-    global DOCKER_CLIENT
-    if DOCKER_CLIENT is None:
-        try:
-            logger.info(f'{log_prompt} - init and login the docker client')
-            DOCKER_CLIENT = docker.from_env(timeout=timeout)
-            docker_user = os.getenv('DOCKERHUB_USER')
-            docker_pass = os.getenv('DOCKERHUB_PASSWORD')
-            DOCKER_CLIENT.login(username=docker_user,
-                                password=docker_pass,
-                                registry="https://index.docker.io/v1")
-        except Exception:
-            logger.exception(f'{log_prompt} - failed to login to docker registry')
+    global DOCKER_CLIENT, DOCKER_HUB_LOGIN
+    # Linters are created concurrently, make sure only one of them inits the client
+    with DOCKER_CLIENT_LOCK:
+        if DOCKER_CLIENT is None:
+            try:
+                logger.info(f'{log_prompt} - init and login the docker client')
+                DOCKER_CLIENT = docker.from_env(timeout=timeout)
+                docker_user = os.getenv('DOCKERHUB_USER')
+                docker_pass = os.getenv('DOCKERHUB_PASSWORD')
+                DOCKER_HUB_LOGIN = False
+                if docker_user and docker_pass:
+                    DOCKER_CLIENT.login(username=docker_user,
+                                        password=docker_pass,
+                                        registry="https://index.docker.io/v1")
+                    DOCKER_HUB_LOGIN = DOCKER_CLIENT.ping()
+            except Exception:
+                logger.exception(f'{log_prompt} - failed to login to docker registry')
 
     return DOCKER_CLIENT
 
@@ -83,15 +94,14 @@ class Docker:
             files: a list of (target path in container, source path in machine).
         """
         if files:
-            with tempfile.NamedTemporaryFile() as tar_file_path:
-                with tarfile.open(name=tar_file_path.name, mode='w') as tar_file:
-                    for dst, src in files:
-                        try:
-                            tar_file.add(src, arcname=dst)
-                        except Exception as error:
-                            logger.debug(error)
-                with open(tar_file_path.name, 'rb') as byte_file:
-                    container.put_archive('/', byte_file.read())
+            file_like_object = io.BytesIO()
+            with tarfile.open(fileobj=file_like_object, mode='w') as tar_file:
+                for dst, src in files:
+                    try:
+                        tar_file.add(src, arcname=dst)
+                    except Exception as error:
+                        logger.debug(error)
+            container.put_archive('/', file_like_object.getvalue())
 
     @staticmethod
     def create_container(image: str, command: Union[str, List[str]], files_to_push: Optional[List] = None,
@@ -137,7 +147,7 @@ class Docker:
             requirements.touch()
             # list of mounts (see in get_mounts doc string)
             files_to_push = [
-                (f'/{script}', Path(__file__).parent / 'resources' / 'installation_scripts' / script),
+                (f'/{script}', INSTALLATION_SCRIPTS_DIR / script),
                 ('/etc/pip.conf', copy_file('/etc/pip.conf', tmp_dir / 'pip.conf')),
                 ('/etc/ssl/certs/ca-certificates.crt', copy_file('/etc/ssl/certs/ca-certificates.crt', tmp_dir / 'ca-certificates.crt')),
                 ('/test-requirements.txt', requirements),
@@ -8,10 +8,11 @@ import shutil
 import sqlite3
 import tarfile
 import textwrap
+import time
 from contextlib import contextmanager
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Generator, List, Optional, Union
+from typing import Dict, Generator, Iterator, List, Optional, Union
 
 # Third party packages
 import coverage
@@ -54,10 +55,21 @@ WARNING = 0b100
 # Power shell checks
 PWSH_CHECKS = ["pwsh_analyze", "pwsh_test"]
 PY_CHCEKS = ["flake8", "XSOAR_linter", "bandit", "mypy", "vulture", "pytest", "pylint"]
+# Checks exit codes bitmask by pack type
+PWSH_CHECKS_CODE = sum(EXIT_CODES[check] for check in PWSH_CHECKS)
+PY_CHECKS_CODE = sum(EXIT_CODES[check] for check in PY_CHCEKS)
+
+# Pylint plugins linked into the package while running the XSOAR linter
+PYLINT_PLUGINS_DIR = Path(__file__).parent / 'resources' / 'pylint_plugins'
 
 # Line break
 RL = '\n'
 
+# Linters messages classification, used to split warnings and errors from the linters output.
+# 'W:' for python2 xsoar linter, 'W[0-9]' for python3 xsoar linter - same for errors.
+WARNING_MSG_REGEX = re.compile(r'^W\d|W:|W90')
+ERROR_MSG_REGEX = re.compile(r'^E\d|E:|E90')
+
 logger = logging.getLogger('demisto-sdk')
 
 
@@ -166,8 +178,10 @@ def get_test_modules(content_repo: Optional[git.Repo], is_external_repo: bool) -
                     # ok - not 4XX or 5XX
                     modules_content[module] = res.content
                     break
-                elif trial == 2:
+                elif trial == 1:
                     raise requests.exceptions.ConnectionError
+                # Give a transient GitHub failure a moment before retrying
+                time.sleep(1)
 
     modules_content[Path("CommonServerUserPython.py")] = b''
 
@@ -210,8 +224,7 @@ def add_typing_module(lint_files: List[Path], python_version: str):
         pass
     finally:
         for added_module in added_modules:
-            if added_module.exists():
-                added_module.unlink()
+            added_module.unlink(missing_ok=True)
         for back_file in back_lint_files:
             if back_file.exists():
                 original_name = back_file.with_suffix('.py')
@@ -306,6 +319,17 @@ def get_python_version_from_image(image: str, timeout: int = 60) -> str:
     # Run three times
     log_prompt = 'Get python version from image'
     docker_client = init_global_docker_client(timeout=timeout, log_prompt=log_prompt)
+    if docker_client is None:
+        logger.debug(f'{log_prompt} - No docker client, using the default Python version {py_num} for image {image}')
+        return py_num
+
+    # Python based images declare their version in the image environment - avoid running a container if so
+    try:
+        for env_var in (docker_client.images.get(image).attrs.get('Config') or {}).get('Env') or []:
+            if env_var.startswith('PYTHON_VERSION='):
+                return '.'.join(env_var.split('=', 1)[1].split('.')[:2])
+    except docker.errors.DockerException:
+        logger.debug(f'{log_prompt} - Could not inspect the image {image}')
 
     for attempt in range(3):
         try:
@@ -340,27 +364,56 @@ def get_python_version_from_image(image: str, timeout: int = 60) -> str:
     return py_num
 
 
-def get_file_from_container(container_obj: Container, container_path: str, encoding: str = "") -> Union[str, bytes]:
+class _ChunksReader(io.RawIOBase):
+    """ Read-only file object over an iterator of bytes chunks, e.g. a docker-sdk archive stream. """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = iter(chunks)
+        self._chunk = b''
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._chunk:
+            self._chunk = next(self._chunks, b'')
+            if not self._chunk:
+                return 0
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+
+def get_file_from_container(container_obj: Container, container_path: str, encoding: str = "",
+                            dest: Optional[Path] = None) -> Union[str, bytes]:
     """ Copy file from container.
 
     Args:
         container_obj(Container): Container ID to copy file from
         container_path(Path): Path in container image (file)
         encoding(str): valid encoding e.g. utf-8
+        dest(Path): Path in host to write the file to, instead of returning it
 
     Returns:
-        str or bytes: file as string decoded in utf-8
+        str or bytes: file as string decoded in utf-8, empty if written to dest
 
     Raises:
-        IOError: Raise IO error if unable to create temp file
+        IOError: Raise IO error if the file is to be written to dest but is not a regular file in the container
     """
     data: Union[str, bytes] = b''
     archive, stat = container_obj.get_archive(container_path)
-    file_like = io.BytesIO(b"".join(b for b in archive))
-    tar = tarfile.open(fileobj=file_like)
-    before_read = tar.extractfile(stat['name'])
-    if isinstance(before_read, io.BufferedReader):
-        data = before_read.read()
+    # Read the archive as a stream, so it is not loaded into memory as a whole
+    with tarfile.open(fileobj=io.BufferedReader(_ChunksReader(archive)), mode='r|') as tar:
+        before_read = next((tar.extractfile(member) for member in tar if member.name == stat['name']), None)
+        if isinstance(before_read, io.BufferedReader):
+            if dest:
+                with open(dest, 'wb') as dest_file:
+                    shutil.copyfileobj(before_read, dest_file)
+            else:
+                data = before_read.read()
+        elif dest:
+            raise IOError(f'{container_path} is not a regular file in the container, unable to write it to {dest}')
     if encoding and isinstance(data, bytes):
         data = data.decode(encoding)
 
@@ -399,20 +452,27 @@ def copy_dir_to_container(container_obj: Container, host_path: Path, container_p
             raise docker.errors.APIError(message="unable to copy dir to container")
 
 
-def stream_docker_container_output(streamer: Generator) -> None:
+def stream_docker_container_output(streamer: Generator) -> Optional[bytes]:
     """ Stream container logs
 
     Args:
         streamer(Generator): Generator created by docker-sdk
+
+    Returns:
+        bytes: The streamed logs, None if streaming failed midway.
     """
+    output = bytearray()
     try:
         wrapper = textwrap.TextWrapper(initial_indent='\t',
                                        subsequent_indent='\t',
                                        width=150)
         for chunk in streamer:
             logger.info(wrapper.fill(str(chunk.decode('utf-8'))))
+            output += chunk
     except Exception:
-        pass
+        return None
+
+    return bytes(output)
 
 
 @contextmanager
@@ -423,7 +483,7 @@ def pylint_plugin(dest: Path):
     Args:
         dest: Pack path.
     """
-    plugin_dirs = Path(__file__).parent / 'resources' / 'pylint_plugins'
+    plugin_dirs = PYLINT_PLUGINS_DIR
 
     try:
         for file in plugin_dirs.iterdir():
@@ -434,8 +494,7 @@ def pylint_plugin(dest: Path):
     finally:
         for file in plugin_dirs.iterdir():
             if file.is_file() and file.name != '__pycache__' and file.name.split('.')[1] != 'pyc':
-                if os.path.lexists(dest / f'{file.name}'):
-                    (dest / f'{file.name}').unlink()
+                (dest / f'{file.name}').unlink(missing_ok=True)
 
 
 def split_warnings_errors(output: str):
@@ -460,11 +519,9 @@ def split_warnings_errors(output: str):
     # Others list is relevant for mypy and flake8.
     other_msg_list = []
     for msg in output_lst:
-        # 'W:' for python2 xsoar linter
-        # 'W[0-9]' for python3 xsoar linter
-        if (msg.startswith('W') and msg[1].isdigit()) or 'W:' in msg or 'W90' in msg:
+        if WARNING_MSG_REGEX.search(msg):
             warnings_list.append(msg)
-        elif (msg.startswith('E') and msg[1].isdigit()) or 'E:' in msg or 'E90' in msg:
+        elif ERROR_MSG_REGEX.search(msg):
             error_list.append(msg)
         else:
             other_msg_list.append(msg)
@@ -5,7 +5,7 @@ import os
 import re
 import sys
 import textwrap
-from typing import Any, Dict, List, Set, Union
+from typing import Any, Dict, List, Set, Tuple, Union
 
 import docker
 import docker.errors
@@ -29,8 +29,9 @@ from demisto_sdk.commands.common.tools import (find_file, find_type,
                                                print_error, print_v,
                                                print_warning,
                                                retrieve_file_ending)
-from demisto_sdk.commands.lint.helpers import (EXIT_CODES, FAIL, PWSH_CHECKS,
-                                               PY_CHCEKS,
+from demisto_sdk.commands.lint.helpers import (EXIT_CODES, FAIL,
+                                               PWSH_CHECKS_CODE,
+                                               PY_CHECKS_CODE,
                                                build_skipped_exit_code,
                                                generate_coverage_report,
                                                get_test_modules, validate_env)
@@ -38,13 +39,103 @@ from demisto_sdk.commands.lint.linter import Linter
 
 json = JSON_Handler()
 
+logger = logging.getLogger('demisto-sdk')
+sha1Regex = re.compile(r'\b[0-9a-fA-F]{40}\b', re.M)
+# Directories holding the packages, in the content main path and in each pack
+PKGS_DIRS = ('Integrations', 'Scripts')
+# Checks names as shown in the checks report, padded to the longest check name
+LONGEST_CHECK_NAME_LEN = len(max(EXIT_CODES.keys(), key=len))
+CHECKS_REPORT_NAMES = {
+    check: (check if 'XSOAR_linter' in check else check.capitalize()).replace('_', ' ').ljust(LONGEST_CHECK_NAME_LEN)
+    for check in EXIT_CODES
+}
+# Checks statuses as shown in the checks report
+CHECK_SKIPPED_LABEL = f"{Colors.Fg.cyan}[SKIPPED]{Colors.reset}"
+CHECK_FAIL_LABEL = f"{Colors.Fg.red}[FAIL]{Colors.reset}"
+CHECK_PASS_LABEL = f"{Colors.Fg.green}[PASS]{Colors.reset}"
+
+
+def _scan_pkgs_dirs(parent_dir: Path) -> Set[PosixPath]:
+    """ Collect the packages found directly under the Integrations and Scripts directories of parent_dir.
+
+    Args:
+        parent_dir(Path): Content main path or pack path.
+
+    Returns:
+        set: Packages paths.
+    """
+    pkgs: set = set()
+    for pkgs_dir in PKGS_DIRS:
+        pkgs_dir_path = parent_dir / pkgs_dir
+        # Most packs have only one of the directories - attempt the scan rather than stat each of them first
+        try:
+            entries = os.scandir(pkgs_dir_path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with entries:
+            # Hidden directories are skipped, as they were never matched by the former glob patterns
+            pkgs.update(pkgs_dir_path / entry.name for entry in entries
+                        if entry.is_dir() and not entry.name.startswith('.'))
 
-# Third party packages
+    return pkgs
 
-# Local packages
 
-logger = logging.getLogger('demisto-sdk')
-sha1Regex = re.compile(r'\b[0-9a-fA-F]{40}\b', re.M)
+def _scan_packages(content_dir: str) -> Set[PosixPath]:
+    """ Scan a content directory for integration and script packages.
+
+    Args:
+        content_dir(str): Content repo or pack directory to scan.
+
+    Returns:
+        set: Packages paths found under content_dir.
+    """
+    # Get packages from main content path
+    all_pkgs = _scan_pkgs_dirs(Path(content_dir))
+    # Get packages from packs path
+    packs_dir: Path = Path(content_dir) / 'Packs'
+    try:
+        packs = os.scandir(packs_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        return all_pkgs
+    with packs:
+        for pack in packs:
+            if pack.is_dir() and not pack.name.startswith('.'):
+                all_pkgs.update(_scan_pkgs_dirs(packs_dir / pack.name))
+
+    return all_pkgs
+
+
+# Last common commits by repository working directory, active branch, HEAD commit and base branch
+_LAST_COMMON_COMMITS: Dict[Tuple[str, str, str, str], str] = {}
+
+
+def _get_last_common_commit(content_repo: git.Repo, active_branch: str, head_sha: str, base_branch: str) -> str:
+    """ Get the commit to diff the working tree against, cached per repository working directory, active branch, HEAD
+    commit and base branch as it is stable for them and resolving it goes through the remote refs and merge base
+    calculation. The repository object itself is not kept by the cache.
+
+    Args:
+        content_repo(git.Repo): Content repository object.
+        active_branch(str): Name of the active branch.
+        head_sha(str): The active branch commit sha1.
+        base_branch(str): Name of the branch or sha1 commit to run the diff on.
+
+    Returns:
+        str: The last common commit sha1.
+    """
+    key = (str(content_repo.working_dir), active_branch, head_sha, base_branch)
+    if key not in _LAST_COMMON_COMMITS:
+        if base_branch == 'master' and active_branch == 'master':
+            # case 1: comparing master against the latest previous commit
+            last_common_commit = content_repo.remote().refs.master.commit.parents[0].hexsha
+        # cases 2+3: compare the active branch (master\not master) against the given base branch (master\not master)
+        elif sha1Regex.match(base_branch):  # if the base branch is given as a commit hash
+            last_common_commit = base_branch
+        else:
+            last_common_commit = content_repo.merge_base(head_sha, f'{content_repo.remote()}/{base_branch}')[0].hexsha
+        _LAST_COMMON_COMMITS[key] = last_common_commit
+
+    return _LAST_COMMON_COMMITS[key]
 
 
 class LintManager:
@@ -71,6 +162,10 @@ class LintManager:
         self._verbose = not quiet if quiet else verbose
         # Gather facts for manager
         self._facts: dict = self._gather_facts()
+        # Changed directories by base branch, calculated once when filtering changed packages
+        self._changed_dirs: Dict[str, Set[str]] = {}
+        # Packages by scanned content directory, scanned once per run
+        self._packages_by_dir: Dict[str, Set[PosixPath]] = {}
         self._prev_ver = prev_ver
         self._all_packs = all_packs
         # Set 'git' to true if no packs have been specified, 'lint' should operate as 'lint -g'
@@ -89,7 +184,7 @@ class LintManager:
             dependent_on_api_module = get_api_module_dependencies(self._pkgs, self._id_set_path, self._verbose)
             dependent_on_api_module = self._get_packages(content_repo=self._facts["content_repo"],
                                                          input=dependent_on_api_module)
-            self._pkgs = list(set(self._pkgs + dependent_on_api_module))
+            self._pkgs = sorted(set(self._pkgs + dependent_on_api_module), key=str)
             if dependent_on_api_module:
                 print(f'Found {Colors.Fg.cyan}{len(dependent_on_api_module)}{Colors.reset} dependent packages. '
                       f'Executing lint and test on those as well.')
@@ -146,7 +241,8 @@ class LintManager:
                 pipfile_lock_path = pipfile_dir / f'pipfile_python{py_num}/Pipfile.lock'
                 with open(file=pipfile_lock_path) as f:
                     lock_file: dict = json.load(fp=f)["develop"]
-                    facts[f"requirements_{py_num}"] = [key + value["version"] for key, value in  # type: ignore
+                    # py2 and py3 dev requirements mostly overlap - intern them so both lists share the same strings
+                    facts[f"requirements_{py_num}"] = [sys.intern(key + value["version"]) for key, value in  # type: ignore
                                                        lock_file.items()]
                     logger.debug(f"Test requirements successfully collected for python {py_num}:\n"
                                  f" {facts[f'requirements_{py_num}']}")
@@ -205,7 +301,7 @@ class LintManager:
         """
         pkgs: list
         if all_packs or git:
-            pkgs = LintManager._get_all_packages(content_dir=content_repo.working_dir)
+            pkgs = self._get_all_packages(content_dir=content_repo.working_dir)
         else:  # specific pack as input, -i flag has been used
             pkgs = []
             if isinstance(input, str):
@@ -213,55 +309,61 @@ class LintManager:
             for item in input:
                 is_pack = os.path.isdir(item) and os.path.exists(os.path.join(item, PACKS_PACK_META_FILE_NAME))
                 if is_pack:
-                    pkgs.extend(LintManager._get_all_packages(content_dir=item))
+                    pkgs.extend(self._get_all_packages(content_dir=item))
                 else:
                     pkgs.append(Path(item))
         if git:
             pkgs = self._filter_changed_packages(content_repo=content_repo, pkgs=pkgs,
                                                  base_branch=base_branch)
-            for pkg in pkgs:
-                print_v(f"Found changed package {Colors.Fg.cyan}{pkg}{Colors.reset}",
-                        log_verbose=self._verbose)
+            if self._verbose:
+                for pkg in pkgs:
+                    print_v(f"Found changed package {Colors.Fg.cyan}{pkg}{Colors.reset}",
+                            log_verbose=self._verbose)
+        # Sorted once here (by the string path) so the lint run order is stable
+        pkgs.sort(key=str)
         if pkgs:
             pkgs_str = ", ".join(map(str, pkgs))
             print(f"Executing lint and test on integrations and scripts in {Colors.Fg.cyan}{pkgs_str}{Colors.reset}")
 
         return pkgs
 
-    @staticmethod
-    def _get_all_packages(content_dir: str) -> List[str]:
+    def _get_all_packages(self, content_dir: str) -> List[str]:
         """Gets all integration, script in packages and packs in content repo.
 
         Returns:
             list: A list of integration, script and beta_integration names.
         """
-        # Get packages from main content path
-        content_main_pkgs: set = set(Path(content_dir).glob(['Integrations/*/',
-                                                             'Scripts/*/', ]))
-        # Get packages from packs path
-        packs_dir: Path = Path(content_dir) / 'Packs'
-        content_packs_pkgs: set = set(packs_dir.glob(['*/Integrations/*/',
-                                                      '*/Scripts/*/']))
-        all_pkgs = content_packs_pkgs.union(content_main_pkgs)
+        # The scan is kept for this run, so scanning the same directory again (e.g. while collecting the packages
+        # dependent on a modified API module) does not walk the file system again.
+        content_dir = os.path.abspath(content_dir)
+        if content_dir not in self._packages_by_dir:
+            self._packages_by_dir[content_dir] = _scan_packages(content_dir)
 
-        return list(all_pkgs)
+        return list(self._packages_by_dir[content_dir])
+
+    def _filter_changed_packages(self, content_repo: git.Repo, pkgs: List[PosixPath],
+                                 base_branch: str) -> List[PosixPath]:
+        """ Checks which packages had changes in them and should run on Lint.
+        The changed directories are calculated once per base branch and cached on the manager.
 
-    @staticmethod
-    def _get_packages_from_modified_files(modified_files):
-        r"""
-        Out of all modified files, return only the files relevant for linting, which are the packages
-        (scripts\integrations) under the pack.
         Args:
-            modified_files: A list of paths of files recognized as modified.
+            content_repo(git.Repo): Content repository object.
+            pkgs(List[PosixPath]): pkgs to check
+            base_branch (str): Name of the branch or sha1 commit to run the diff on.
 
         Returns:
-            A list of paths of modified packages (scripts/integrations)
+            List[PosixPath]: A list of names of packages that should run.
         """
-        return [path for path in modified_files if 'Scripts' in path.parts or 'Intergations' in path.parts]
+        if base_branch not in self._changed_dirs:
+            self._changed_dirs[base_branch] = self._get_changed_dirs(content_repo=content_repo,
+                                                                     base_branch=base_branch)
+        changed_dirs = self._changed_dirs[base_branch]
+
+        return [pkg for pkg in pkgs if str(pkg) in changed_dirs]
 
     @staticmethod
-    def _filter_changed_packages(content_repo: git.Repo, pkgs: List[PosixPath], base_branch: str) -> List[PosixPath]:
-        """ Checks which packages had changes in them and should run on Lint.
+    def _get_changed_dirs(content_repo: git.Repo, base_branch: str) -> Set[str]:
+        """ Get the directories of the files changed compared to the base branch.
         The diff is calculated using git, and is done by the following cases:
         - case 1: If the active branch is 'master', the diff is between master and the previous commit.
         - case 2: If the active branch is not master, and no other base branch is specified to comapre to,
@@ -269,38 +371,50 @@ class LintManager:
         - case 3: If the base branch is specified, the diff is between the active branch (master\not master) and the given base branch.
 
         Args:
-            pkgs(List[PosixPath]): pkgs to check
+            content_repo(git.Repo): Content repository object.
             base_branch (str): Name of the branch or sha1 commit to run the diff on.
 
         Returns:
-            List[PosixPath]: A list of names of packages that should run.
+            Set[str]: The directories of the changed files (plain strings, cheaper to hash than paths).
         """
-
-        staged_files = {content_repo.working_dir / Path(item.b_path).parent for item in
-                        content_repo.active_branch.commit.tree.diff(None, paths=pkgs)}
-
-        if base_branch == 'master' and content_repo.active_branch.name == 'master':
-            # case 1: comparing master against the latest previous commit
-            last_common_commit = content_repo.remote().refs.master.commit.parents[0]
+        # Each active_branch access resolves HEAD with git again - resolve it once
+        active_branch = content_repo.active_branch
+        last_common_commit = _get_last_common_commit(content_repo, active_branch.name, active_branch.commit.hexsha,
+                                                     base_branch)
+        if base_branch == 'master' and active_branch.name == 'master':
             print(f"Comparing {Colors.Fg.cyan}master{Colors.reset} to its {Colors.Fg.cyan}previous commit: "
                   f"{last_common_commit} {Colors.reset}")
-
         else:
-            # cases 2+3: compare the active branch (master\not master) against the given base branch (master\not master)
-            if sha1Regex.match(base_branch):  # if the base branch is given as a commit hash
-                last_common_commit = base_branch
-            else:
-                last_common_commit = content_repo.merge_base(content_repo.active_branch.commit,
-                                                             f'{content_repo.remote()}/{base_branch}')[0]
-            print(f"Comparing {Colors.Fg.cyan}{content_repo.active_branch}{Colors.reset} to"
+            print(f"Comparing {Colors.Fg.cyan}{active_branch}{Colors.reset} to"
                   f" last common commit with {Colors.Fg.cyan}{last_common_commit}{Colors.reset}")
 
-        changed_from_base = {content_repo.working_dir / Path(item.b_path).parent for item in
-                             content_repo.active_branch.commit.tree.diff(last_common_commit, paths=pkgs)}
-        all_changed = staged_files.union(changed_from_base)
-        pkgs_to_check = all_changed.intersection(pkgs)
+        # Diffing the working tree against the last common commit covers both the uncommitted changes and the changes
+        # committed since the base branch, in a single git call. The output is NUL delimited so paths are not quoted.
+        changed_files = content_repo.git.diff('--name-only', '-z', last_common_commit).split('\0')
+        return {os.path.join(content_repo.working_dir, os.path.dirname(changed_file)) for changed_file in changed_files
+                if changed_file}
+
+    def _run_linter(self, pack: PosixPath, docker_timeout: int, **kwargs) -> dict:
+        """ Creates the package Linter and runs the lint and test checks on it.
+        Executed in the worker threads, so the Linter creation (package facts gathering, docker client) is done in
+        parallel as well.
+
+        Args:
+            pack(PosixPath): Package directory to run on.
+            docker_timeout(int): timeout for docker requests
+            kwargs: Linter.run_dev_packages arguments.
 
-        return list(pkgs_to_check)
+        Returns:
+            dict: The package status.
+        """
+        linter: Linter = Linter(pack_dir=pack,
+                                content_repo="" if not self._facts["content_repo"] else
+                                Path(self._facts["content_repo"].working_dir),
+                                req_2=self._facts["requirements_2"],
+                                req_3=self._facts["requirements_3"],
+                                docker_engine=self._facts["docker_engine"],
+                                docker_timeout=docker_timeout)
+        return linter.run_dev_packages(**kwargs)
 
     def run_dev_packages(self, parallel: int, no_flake8: bool, no_xsoar_linter: bool, no_bandit: bool, no_mypy: bool,
                          no_pylint: bool, no_coverage: bool, coverage_report: str,
@@ -370,51 +484,51 @@ class LintManager:
         with concurrent.futures.ThreadPoolExecutor(max_workers=parallel) as executor:
             return_exit_code: int = 0
             return_warning_code: int = 0
-            results = []
+            results: Dict[concurrent.futures.Future, PosixPath] = {}
+            # Failed and warning packages lists by check exit code
+            fail_packs_by_code = {code: lint_status[f"fail_packs_{check}"] for check, code in EXIT_CODES.items()}
+            warning_packs_by_code = {code: lint_status[f"warning_packs_{check}"] for check, code in EXIT_CODES.items()}
             # Executing lint checks in different threads
-            for pack in sorted(self._pkgs):
-                linter: Linter = Linter(pack_dir=pack,
-                                        content_repo="" if not self._facts["content_repo"] else
-                                        Path(self._facts["content_repo"].working_dir),
-                                        req_2=self._facts["requirements_2"],
-                                        req_3=self._facts["requirements_3"],
-                                        docker_engine=self._facts["docker_engine"],
-                                        docker_timeout=docker_timeout)
-                results.append(executor.submit(linter.run_dev_packages,
-                                               no_flake8=no_flake8,
-                                               no_bandit=no_bandit,
-                                               no_mypy=no_mypy,
-                                               no_vulture=no_vulture,
-                                               no_xsoar_linter=no_xsoar_linter,
-                                               no_pylint=no_pylint,
-                                               no_test=no_test,
-                                               no_pwsh_analyze=no_pwsh_analyze,
-                                               no_pwsh_test=no_pwsh_test,
-                                               modules=self._facts["test_modules"],
-                                               keep_container=keep_container,
-                                               test_xml=test_xml,
-                                               no_coverage=no_coverage))
+            for pack in self._pkgs:
+                future = executor.submit(self._run_linter,
+                                         pack=pack,
+                                         docker_timeout=docker_timeout,
+                                         no_flake8=no_flake8,
+                                         no_bandit=no_bandit,
+                                         no_mypy=no_mypy,
+                                         no_vulture=no_vulture,
+                                         no_xsoar_linter=no_xsoar_linter,
+                                         no_pylint=no_pylint,
+                                         no_test=no_test,
+                                         no_pwsh_analyze=no_pwsh_analyze,
+                                         no_pwsh_test=no_pwsh_test,
+                                         modules=self._facts["test_modules"],
+                                         keep_container=keep_container,
+                                         test_xml=test_xml,
+                                         no_coverage=no_coverage)
+                results[future] = pack
             try:
                 for future in concurrent.futures.as_completed(results):
-                    pkg_status = future.result()
+                    try:
+                        pkg_status = future.result()
+                    except Exception:
+                        logger.exception(f"Lint and test failed on {results[future]}")
+                        raise
                     pkgs_status[pkg_status["pkg"]] = pkg_status
-                    if pkg_status["exit_code"]:
-                        for check, code in EXIT_CODES.items():
-                            if pkg_status["exit_code"] & code:
-                                lint_status[f"fail_packs_{check}"].append(pkg_status["pkg"])
-                        if not return_exit_code & pkg_status["exit_code"]:
-                            return_exit_code += pkg_status["exit_code"]
-                    if pkg_status["warning_code"]:
-                        for check, code in EXIT_CODES.items():
-                            if pkg_status["warning_code"] & code:
-                                lint_status[f"warning_packs_{check}"].append(pkg_status["pkg"])
-                        if not return_warning_code & pkg_status["warning_code"]:
-                            return_warning_code += pkg_status["warning_code"]
+                    self._add_pkg_to_checks_packs(pkg=pkg_status["pkg"], code=pkg_status["exit_code"],
+                                                  packs_by_code=fail_packs_by_code)
+                    return_exit_code |= pkg_status["exit_code"]
+                    self._add_pkg_to_checks_packs(pkg=pkg_status["pkg"], code=pkg_status["warning_code"],
+                                                  packs_by_code=warning_packs_by_code)
+                    return_warning_code |= pkg_status["warning_code"]
                     if pkg_status["pack_type"] not in pkgs_type:
                         pkgs_type.append(pkg_status["pack_type"])
             except KeyboardInterrupt:
                 print_warning("Stop demisto-sdk lint - Due to 'Ctrl C' signal")
                 try:
+                    # Cancel the packages that did not start yet, otherwise the executor exit waits for all of them
+                    for future in results:
+                        future.cancel()
                     executor.shutdown(wait=False)
                 except Exception:
                     pass
@@ -422,6 +536,8 @@ class LintManager:
             except Exception as e:
                 print_warning(f"Stop demisto-sdk lint - Due to Exception {e}")
                 try:
+                    for future in results:
+                        future.cancel()
                     executor.shutdown(wait=False)
                 except Exception:
                     pass
@@ -447,6 +563,22 @@ class LintManager:
             return_exit_code = FAIL
         return return_exit_code
 
+    @staticmethod
+    def _add_pkg_to_checks_packs(pkg: str, code: int, packs_by_code: Dict[int, list]):
+        """ Add package to the packages list of each check set in the given exit code.
+
+        Args:
+            pkg(str): Package name.
+            code(int): Package exit code or warning code.
+            packs_by_code(dict): Packages lists by check exit code.
+        """
+        # Visit only the set bits of the code
+        while code:
+            check_code = code & -code
+            if check_code in packs_by_code:
+                packs_by_code[check_code].append(pkg)
+            code ^= check_code
+
     def _report_results(self, lint_status: dict, pkgs_status: dict, return_exit_code: int, return_warning_code: int,
                         skipped_code: int,
                         pkgs_type: list,
@@ -488,6 +620,18 @@ class LintManager:
         self.report_summary(pkg=self._pkgs, lint_status=lint_status, all_packs=self._all_packs)
         self.create_json_output()
 
+    @staticmethod
+    def _print_headline(sentence: str, color: str):
+        """ Print a report section headline - the sentence between two lines of '#'
+
+        Args:
+            sentence(str): Headline sentence.
+            color(str): Headline color.
+        """
+        print(f"\n{color}{'#' * len(sentence)}{Colors.reset}\n"
+              f"{color}{sentence}{Colors.reset}\n"
+              f"{color}{'#' * len(sentence)}{Colors.reset}\n")
+
     @staticmethod
     def report_pass_lint_checks(return_exit_code: int, skipped_code: int, pkgs_type: list):
         """ Log PASS/FAIL on each lint/test
@@ -497,22 +641,23 @@ class LintManager:
             skipped_code(int): skipped test code.
             pkgs_type(list): list determine which pack type exits.
          """
-        longest_check_key = len(max(EXIT_CODES.keys(), key=len))
+        # Exit codes of the checks relevant to the given packs types
+        pkgs_type_checks_code = 0
+        if TYPE_PYTHON in pkgs_type:
+            pkgs_type_checks_code |= PY_CHECKS_CODE
+        if TYPE_PWSH in pkgs_type:
+            pkgs_type_checks_code |= PWSH_CHECKS_CODE
         for check, code in EXIT_CODES.items():
-            spacing = longest_check_key - len(check)
-            if 'XSOAR_linter' in check:
-                check_str = check.replace('_', ' ')
-            else:
-                check_str = check.capitalize().replace('_', ' ')
-            if (check in PY_CHCEKS and TYPE_PYTHON in pkgs_type) or (check in PWSH_CHECKS and TYPE_PWSH in pkgs_type):
+            check_str = CHECKS_REPORT_NAMES[check]
+            if code & pkgs_type_checks_code:
                 if code & skipped_code:
-                    print(f"{check_str} {' ' * spacing}- {Colors.Fg.cyan}[SKIPPED]{Colors.reset}")
+                    print(f"{check_str} - {CHECK_SKIPPED_LABEL}")
                 elif code & return_exit_code:
-                    print(f"{check_str} {' ' * spacing}- {Colors.Fg.red}[FAIL]{Colors.reset}")
+                    print(f"{check_str} - {CHECK_FAIL_LABEL}")
                 else:
-                    print(f"{check_str} {' ' * spacing}- {Colors.Fg.green}[PASS]{Colors.reset}")
+                    print(f"{check_str} - {CHECK_PASS_LABEL}")
             elif check != 'image':
-                print(f"{check_str} {' ' * spacing}- {Colors.Fg.cyan}[SKIPPED]{Colors.reset}")
+                print(f"{check_str} - {CHECK_SKIPPED_LABEL}")
 
     def report_failed_lint_checks(self, lint_status: dict, pkgs_status: dict, return_exit_code: int):
         """ Log failed lint log if exsits
@@ -525,12 +670,10 @@ class LintManager:
         for check in ["flake8", "XSOAR_linter", "bandit", "mypy", "vulture"]:
             if EXIT_CODES[check] & return_exit_code:
                 sentence = f" {check.capitalize()} errors "
-                print(f"\n{Colors.Fg.red}{'#' * len(sentence)}{Colors.reset}")
-                print(f"{Colors.Fg.red}{sentence}{Colors.reset}")
-                print(f"{Colors.Fg.red}{'#' * len(sentence)}{Colors.reset}\n")
+                self._print_headline(sentence=sentence, color=Colors.Fg.red)
                 for fail_pack in lint_status[f"fail_packs_{check}"]:
-                    print(f"{Colors.Fg.red}{pkgs_status[fail_pack]['pkg']}{Colors.reset}")
-                    print(pkgs_status[fail_pack][f"{check}_errors"])
+                    print(f"{Colors.Fg.red}{pkgs_status[fail_pack]['pkg']}{Colors.reset}\n"
+                          f"{pkgs_status[fail_pack][f'{check}_errors']}")
                     self.linters_error_list.append({
                         'linter': check,
                         'pack': fail_pack,
@@ -542,13 +685,10 @@ class LintManager:
             check_str = check.capitalize().replace('_', ' ')
             if EXIT_CODES[check] & return_exit_code:
                 sentence = f" {check_str} errors "
-                print(f"\n{Colors.Fg.red}{'#' * len(sentence)}{Colors.reset}")
-                print(f"{Colors.Fg.red}{sentence}{Colors.reset}")
-                print(f"{Colors.Fg.red}{'#' * len(sentence)}{Colors.reset}\n")
+                self._print_headline(sentence=sentence, color=Colors.Fg.red)
                 for fail_pack in lint_status[f"fail_packs_{check}"]:
-                    print(f"{Colors.Fg.red}{fail_pack}{Colors.reset}")
-                    for image in pkgs_status[fail_pack]["images"]:
-                        print(image[f"{check}_errors"])
+                    print("\n".join([f"{Colors.Fg.red}{fail_pack}{Colors.reset}"] +
+                                    [image[f"{check}_errors"] for image in pkgs_status[fail_pack]["images"]]))
 
     def report_warning_lint_checks(self, lint_status: dict, pkgs_status: dict, return_warning_code: int,
                                    all_packs: bool):
@@ -564,12 +704,10 @@ class LintManager:
             for check in ["flake8", "XSOAR_linter", "bandit", "mypy", "vulture"]:
                 if EXIT_CODES[check] & return_warning_code:
                     sentence = f" {check.capitalize()} warnings "
-                    print(f"\n{Colors.Fg.orange}{'#' * len(sentence)}{Colors.reset}")
-                    print(f"{Colors.Fg.orange}{sentence}{Colors.reset}")
-                    print(f"{Colors.Fg.orange}{'#' * len(sentence)}{Colors.reset}\n")
+                    self._print_headline(sentence=sentence, color=Colors.Fg.orange)
                     for fail_pack in lint_status[f"warning_packs_{check}"]:
-                        print(f"{Colors.Fg.orange}{pkgs_status[fail_pack]['pkg']}{Colors.reset}")
-                        print(pkgs_status[fail_pack][f"{check}_warnings"])
+                        print(f"{Colors.Fg.orange}{pkgs_status[fail_pack]['pkg']}{Colors.reset}\n"
+                              f"{pkgs_status[fail_pack][f'{check}_warnings']}")
                         self.linters_error_list.append({
                             'linter': check,
                             'pack': fail_pack,
@@ -612,34 +750,36 @@ class LintManager:
         # Log passed unit-tests
         headline_printed = False
         passed_printed = False
-        for pkg, status in pkgs_status.items():
-            if status.get("images"):
-                if status.get("images")[0].get("pytest_json", {}).get("report", {}).get("tests"):
-                    if (not headline_printed and self._verbose) and (EXIT_CODES["pytest"] & return_exit_code):
-                        # Log unit-tests
-                        sentence = " Unit Tests "
-                        print(f"\n{Colors.Fg.cyan}{'#' * len(sentence)}")
-                        print(f"{sentence}")
-                        print(f"{'#' * len(sentence)}{Colors.reset}")
-                        headline_printed = True
-                    if not passed_printed:
-                        print_v(f"\n{Colors.Fg.green}Passed Unit-tests:{Colors.reset}", log_verbose=self._verbose)
-                        passed_printed = True
-                    print_v(wrapper_pack.fill(f"{Colors.Fg.green}{pkg}{Colors.reset}"), log_verbose=self._verbose)
-                    for image in status["images"]:
-                        if not image.get("image_errors"):
-                            tests = image.get("pytest_json", {}).get("report", {}).get("tests")
-                            if tests:
-                                print_v(wrapper_docker_image.fill(image['image']), log_verbose=self._verbose)
-                                for test_case in tests:
-                                    outcome = test_case.get("call", {}).get("outcome")
-                                    if outcome != "failed":
-                                        name = re.sub(pattern=r"\[.*\]",
-                                                      repl="",
-                                                      string=test_case.get("name"))
-                                        if outcome and outcome != "passed":
-                                            name = f'{name} ({outcome.upper()})'
-                                        print_v(wrapper_test.fill(name), log_verbose=self._verbose)
+        # Passed unit-tests are logged only in verbose mode - skip formatting them otherwise
+        if self._verbose:
+            for pkg, status in pkgs_status.items():
+                if status.get("images"):
+                    if status.get("images")[0].get("pytest_json", {}).get("report", {}).get("tests"):
+                        if not headline_printed and (EXIT_CODES["pytest"] & return_exit_code):
+                            # Log unit-tests
+                            sentence = " Unit Tests "
+                            print(f"\n{Colors.Fg.cyan}{'#' * len(sentence)}")
+                            print(f"{sentence}")
+                            print(f"{'#' * len(sentence)}{Colors.reset}")
+                            headline_printed = True
+                        if not passed_printed:
+                            print_v(f"\n{Colors.Fg.green}Passed Unit-tests:{Colors.reset}", log_verbose=self._verbose)
+                            passed_printed = True
+                        print_v(wrapper_pack.fill(f"{Colors.Fg.green}{pkg}{Colors.reset}"), log_verbose=self._verbose)
+                        for image in status["images"]:
+                            if not image.get("image_errors"):
+                                tests = image.get("pytest_json", {}).get("report", {}).get("tests")
+                                if tests:
+                                    print_v(wrapper_docker_image.fill(image['image']), log_verbose=self._verbose)
+                                    for test_case in tests:
+                                        outcome = test_case.get("call", {}).get("outcome")
+                                        if outcome != "failed":
+                                            name = re.sub(pattern=r"\[.*\]",
+                                                          repl="",
+                                                          string=test_case.get("name"))
+                                            if outcome and outcome != "passed":
+                                                name = f'{name} ({outcome.upper()})'
+                                            print_v(wrapper_test.fill(name), log_verbose=self._verbose)
 
         # Log failed unit-tests
         if EXIT_CODES["pytest"] & return_exit_code:
@@ -649,9 +789,10 @@ class LintManager:
                 print(f"\n{Colors.Fg.cyan}{'#' * len(sentence)}")
                 print(f"{sentence}")
                 print(f"{'#' * len(sentence)}{Colors.reset}")
-            print(f"\n{Colors.Fg.red}Failed Unit-tests:{Colors.reset}")
+            # Failed unit-tests may be many lines, collect them and print at once
+            failed_lines = [f"\n{Colors.Fg.red}Failed Unit-tests:{Colors.reset}"]
             for fail_pack in lint_status["fail_packs_pytest"]:
-                print(wrapper_pack.fill(f"{Colors.Fg.red}{fail_pack}{Colors.reset}"))
+                failed_lines.append(wrapper_pack.fill(f"{Colors.Fg.red}{fail_pack}{Colors.reset}"))
                 for image in pkgs_status[fail_pack]["images"]:
                     tests = image.get("pytest_json", {}).get("report", {}).get("tests")
                     if tests:
@@ -660,21 +801,22 @@ class LintManager:
                                 name = re.sub(pattern=r"\[.*\]",
                                               repl="",
                                               string=test_case.get("name"))
-                                print(wrapper_test.fill(name))
+                                failed_lines.append(wrapper_test.fill(name))
                                 if test_case.get("call", {}).get("longrepr"):
-                                    print(wrapper_docker_image.fill(image['image']))
+                                    failed_lines.append(wrapper_docker_image.fill(image['image']))
                                     for i in range(len(test_case.get("call", {}).get("longrepr"))):
                                         if i == 0:
-                                            print(wrapper_first_error.fill(
+                                            failed_lines.append(wrapper_first_error.fill(
                                                 test_case.get("call", {}).get("longrepr")[i]))
                                         else:
-                                            print(wrapper_sec_error.fill(test_case.get("call", {}).get("longrepr")[i]))
-                                    print('\n')
+                                            failed_lines.append(wrapper_sec_error.fill(test_case.get("call", {}).get("longrepr")[i]))
+                                    failed_lines.append('\n')
                     else:
-                        print(wrapper_docker_image.fill(image['image']))
+                        failed_lines.append(wrapper_docker_image.fill(image['image']))
                         errors = image.get("pytest_errors", {})
                         if errors:
-                            print(wrapper_sec_error.fill(errors))
+                            failed_lines.append(wrapper_sec_error.fill(errors))
+            print("\n".join(failed_lines))
 
     @staticmethod
     def report_failed_image_creation(lint_status: dict, pkgs_status: dict, return_exit_code: int):
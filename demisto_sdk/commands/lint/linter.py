@@ -4,7 +4,9 @@ import hashlib
 import logging
 import os
 import platform
+import threading
 import traceback
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 import docker
@@ -23,11 +25,13 @@ from demisto_sdk.commands.common.handlers import JSON_Handler, YAML_Handler
 from demisto_sdk.commands.common.timers import timer
 from demisto_sdk.commands.common.tools import (get_all_docker_images,
                                                run_command_os)
+from demisto_sdk.commands.lint import docker_helper
 from demisto_sdk.commands.lint.commands_builder import (
     build_bandit_command, build_flake8_command, build_mypy_command,
     build_pwsh_analyze_command, build_pwsh_test_command, build_pylint_command,
     build_pytest_command, build_vulture_command, build_xsoar_linter_command)
-from demisto_sdk.commands.lint.docker_helper import Docker
+from demisto_sdk.commands.lint.docker_helper import (Docker,
+                                                     init_global_docker_client)
 from demisto_sdk.commands.lint.helpers import (EXIT_CODES, FAIL, RERUN, RL,
                                                SUCCESS, WARNING,
                                                add_tmp_lint_files,
@@ -47,6 +51,27 @@ json = JSON_Handler()
 # Local packages
 
 logger = logging.getLogger('demisto-sdk')
+# Locks by test image name - packages sharing a test image wait for the first of them to pull or create it, instead
+# of creating the same image concurrently
+TEST_IMAGES_LOCKS: Dict[str, threading.Lock] = {}
+# User to run the lint/test containers with, falls back to 4000 for root and for hosts without uids
+CONTAINER_USER = f"{getattr(os, 'getuid', lambda: 4000)() or 4000}:4000"
+
+
+@lru_cache(maxsize=300)
+def get_test_image_name(base_image: str, pip_requirements: Tuple[str, ...]) -> str:
+    """ Get the test image name for a base image and the pip requirements installed on it.
+    Cached, as most packages share the same few combinations.
+
+    Args:
+        base_image(str): Docker image the test image is based on.
+        pip_requirements(tuple): Pip requirements installed on the test image.
+
+    Returns:
+        str: Test image name.
+    """
+    identifier = hashlib.md5("\n".join(sorted(pip_requirements)).encode("utf-8")).hexdigest()
+    return f'devtest{base_image}-{identifier}'
 
 
 class Linter:
@@ -62,15 +87,16 @@ class Linter:
 
     def __init__(self, pack_dir: Path, content_repo: Path, req_3: list, req_2: list, docker_engine: bool,
                  docker_timeout: int):
-        self._req_3 = req_3
-        self._req_2 = req_2
+        # Test requirements by the python major version of the image
+        self._requirements_by_major: Dict[int, list] = {2: req_2, 3: req_3}
         self._content_repo = content_repo
         self._pack_abs_dir = pack_dir
         self._pack_name = None
         self.docker_timeout = docker_timeout
         # Docker client init
         if docker_engine:
-            self._docker_client: docker.DockerClient = docker.from_env(timeout=docker_timeout)
+            self._docker_client: docker.DockerClient = init_global_docker_client(timeout=docker_timeout,
+                                                                                 log_prompt='Linter')
             self._docker_hub_login = self._docker_login()
         # Facts gathered regarding pack lint and test
         self._facts: Dict[str, Any] = {
@@ -335,11 +361,15 @@ class Linter:
         error = []
         other = []
         exit_code: int = 0
-        for lint_check in ["flake8", "XSOAR_linter", "bandit", "mypy", "vulture"]:
+        # Filter the disabled checks out once, so the loop only visits the checks that should run
+        skipped_checks = {"flake8": no_flake8, "XSOAR_linter": no_xsoar_linter, "bandit": no_bandit, "mypy": no_mypy,
+                          "vulture": no_vulture}
+        enabled_checks = [lint_check for lint_check, skipped in skipped_checks.items() if not skipped]
+        for lint_check in enabled_checks:
             exit_code = SUCCESS
             output = ""
             if self._facts["lint_files"] or self._facts["lint_unittest_files"]:
-                if lint_check == "flake8" and not no_flake8:
+                if lint_check == "flake8":
                     flake8_lint_files = copy.deepcopy(self._facts["lint_files"])
                     # if there are unittest.py then we would run flake8 on them too.
                     if self._facts['lint_unittest_files']:
@@ -348,16 +378,16 @@ class Linter:
                                                          lint_files=flake8_lint_files)
 
             if self._facts["lint_files"]:
-                if lint_check == "XSOAR_linter" and not no_xsoar_linter:
+                if lint_check == "XSOAR_linter":
                     exit_code, output = self._run_xsoar_linter(py_num=self._facts["python_version"],
                                                                lint_files=self._facts["lint_files"])
-                elif lint_check == "bandit" and not no_bandit:
+                elif lint_check == "bandit":
                     exit_code, output = self._run_bandit(lint_files=self._facts["lint_files"])
 
-                elif lint_check == "mypy" and not no_mypy:
+                elif lint_check == "mypy":
                     exit_code, output = self._run_mypy(py_num=self._facts["python_version"],
                                                        lint_files=self._facts["lint_files"])
-                elif lint_check == "vulture" and not no_vulture:
+                elif lint_check == "vulture":
                     exit_code, output = self._run_vulture(py_num=self._facts["python_version"],
                                                           lint_files=self._facts["lint_files"])
 
@@ -376,6 +406,23 @@ class Linter:
                 else:
                     self._pkg_lint_status[f"{lint_check}_errors"] = "\n".join(other)
 
+    @staticmethod
+    def _log_run_finished(log_prompt: str, exit_code: int, stdout: str, stderr: str):
+        """ Log the exit code and output of a lint run in debug level.
+            The output is formatted only if debug is enabled, as it might be large.
+
+        Args:
+            log_prompt(str): Log prompt of the lint run.
+            exit_code(int): Exit code of the lint run.
+            stdout(str): Lint run stdout.
+            stderr(str): Lint run stderr.
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug(f"{log_prompt} - Finished, exit-code: {exit_code}")
+        logger.debug(f"{log_prompt} - Finished, stdout: {RL if stdout else ''}{stdout}")
+        logger.debug(f"{log_prompt} - Finished, stderr: {RL if stderr else ''}{stderr}")
+
     @timer(group_name='lint')
     def _run_flake8(self, py_num: str, lint_files: List[Path]) -> Tuple[int, str]:
         """ Runs flake8 in pack dir
@@ -392,9 +439,7 @@ class Linter:
         logger.info(f"{log_prompt} - Start")
         stdout, stderr, exit_code = run_command_os(command=build_flake8_command(lint_files, py_num),
                                                    cwd=self._content_repo)
-        logger.debug(f"{log_prompt} - Finished, exit-code: {exit_code}")
-        logger.debug(f"{log_prompt} - Finished, stdout: {RL if stdout else ''}{stdout}")
-        logger.debug(f"{log_prompt} - Finished, stderr: {RL if stderr else ''}{stderr}")
+        self._log_run_finished(log_prompt=log_prompt, exit_code=exit_code, stdout=stdout, stderr=stderr)
         if stderr or exit_code:
             logger.error(f"{log_prompt}- Finished, errors found")
             if stderr:
@@ -461,9 +506,7 @@ class Linter:
                          " the necessary Pylint version for both py2 and py3"
             logger.error(f"{log_prompt}- Finished, errors found")
 
-        logger.debug(f"{log_prompt} - Finished, exit-code: {exit_code}")
-        logger.debug(f"{log_prompt} - Finished, stdout: {RL if stdout else ''}{stdout}")
-        logger.debug(f"{log_prompt} - Finished, stderr: {RL if stderr else ''}{stderr}")
+        self._log_run_finished(log_prompt=log_prompt, exit_code=exit_code, stdout=stdout, stderr=stderr)
 
         if not exit_code:
             logger.info(f"{log_prompt} - Successfully finished")
@@ -485,9 +528,7 @@ class Linter:
         logger.info(f"{log_prompt} - Start")
         stdout, stderr, exit_code = run_command_os(command=build_bandit_command(lint_files),
                                                    cwd=self._pack_abs_dir)
-        logger.debug(f"{log_prompt} - Finished, exit-code: {exit_code}")
-        logger.debug(f"{log_prompt} - Finished, stdout: {RL if stdout else ''}{stdout}")
-        logger.debug(f"{log_prompt} - Finished, stderr: {RL if stderr else ''}{stderr}")
+        self._log_run_finished(log_prompt=log_prompt, exit_code=exit_code, stdout=stdout, stderr=stderr)
         if stderr or exit_code:
             logger.error(f"{log_prompt}- Finished, errors found")
             if stderr:
@@ -516,9 +557,7 @@ class Linter:
         with add_typing_module(lint_files=lint_files, python_version=py_num):
             mypy_command = build_mypy_command(files=lint_files, version=py_num, content_repo=self._content_repo)
             stdout, stderr, exit_code = run_command_os(command=mypy_command, cwd=self._pack_abs_dir)
-        logger.debug(f"{log_prompt} - Finished, exit-code: {exit_code}")
-        logger.debug(f"{log_prompt} - Finished, stdout: {RL if stdout else ''}{stdout}")
-        logger.debug(f"{log_prompt} - Finished, stderr: {RL if stderr else ''}{stderr}")
+        self._log_run_finished(log_prompt=log_prompt, exit_code=exit_code, stdout=stdout, stderr=stderr)
         if stderr or exit_code:
             logger.error(f"{log_prompt}- Finished, errors found")
             if stderr:
@@ -548,9 +587,7 @@ class Linter:
                                                                                  pack_path=self._pack_abs_dir,
                                                                                  py_num=py_num),
                                                    cwd=self._pack_abs_dir)
-        logger.debug(f"{log_prompt} - Finished, exit-code: {exit_code}")
-        logger.debug(f"{log_prompt} - Finished, stdout: {RL if stdout else ''}{stdout}")
-        logger.debug(f"{log_prompt} - Finished, stderr: {RL if stderr else ''}{stderr}")
+        self._log_run_finished(log_prompt=log_prompt, exit_code=exit_code, stdout=stdout, stderr=stderr)
         if stderr or exit_code:
             logger.error(f"{log_prompt}- Finished, errors found")
             if stderr:
@@ -577,6 +614,12 @@ class Linter:
             no_coverage(bool): Run pytest without coverage report
 
         """
+        # Docker checks of the pack type which were not skipped - the same for all of the pack images
+        skipped_checks = {
+            TYPE_PYTHON: {"pylint": no_pylint, "pytest": no_test},
+            TYPE_PWSH: {"pwsh_analyze": no_pwsh_analyze, "pwsh_test": no_pwsh_test},
+        }.get(self._pkg_lint_status["pack_type"], {})
+        docker_checks = [check for check, skipped in skipped_checks.items() if not skipped]
         for image in self._facts["images"]:
             # Docker image status - visualize
             status = {
@@ -598,31 +641,29 @@ class Linter:
 
             if image_id and not errors:
                 # Set image creation status
-                for check in ["pylint", "pytest", "pwsh_analyze", "pwsh_test"]:
+                for check in docker_checks:
                     exit_code = SUCCESS
                     output = ""
                     for trial in range(2):
-                        if self._pkg_lint_status["pack_type"] == TYPE_PYTHON:
-                            # Perform pylint
-                            if not no_pylint and check == "pylint" and self._facts["lint_files"]:
-                                exit_code, output = self._docker_run_pylint(test_image=image_id,
-                                                                            keep_container=keep_container)
-                            # Perform pytest
-                            elif not no_test and self._facts["test"] and check == "pytest":
-                                exit_code, output, test_json = self._docker_run_pytest(test_image=image_id,
-                                                                                       keep_container=keep_container,
-                                                                                       test_xml=test_xml,
-                                                                                       no_coverage=no_coverage)
-                                status["pytest_json"] = test_json
-                        elif self._pkg_lint_status["pack_type"] == TYPE_PWSH:
-                            # Perform powershell analyze
-                            if not no_pwsh_analyze and check == "pwsh_analyze" and self._facts["lint_files"]:
-                                exit_code, output = self._docker_run_pwsh_analyze(test_image=image_id,
-                                                                                  keep_container=keep_container)
-                            # Perform powershell test
-                            elif not no_pwsh_test and check == "pwsh_test":
-                                exit_code, output = self._docker_run_pwsh_test(test_image=image_id,
-                                                                               keep_container=keep_container)
+                        # Perform pylint
+                        if check == "pylint" and self._facts["lint_files"]:
+                            exit_code, output = self._docker_run_pylint(test_image=image_id,
+                                                                        keep_container=keep_container)
+                        # Perform pytest
+                        elif check == "pytest" and self._facts["test"]:
+                            exit_code, output, test_json = self._docker_run_pytest(test_image=image_id,
+                                                                                   keep_container=keep_container,
+                                                                                   test_xml=test_xml,
+                                                                                   no_coverage=no_coverage)
+                            status["pytest_json"] = test_json
+                        # Perform powershell analyze
+                        elif check == "pwsh_analyze" and self._facts["lint_files"]:
+                            exit_code, output = self._docker_run_pwsh_analyze(test_image=image_id,
+                                                                              keep_container=keep_container)
+                        # Perform powershell test
+                        elif check == "pwsh_test":
+                            exit_code, output = self._docker_run_pwsh_test(test_image=image_id,
+                                                                           keep_container=keep_container)
                         # If lint check perfrom and failed on reason related to enviorment will run twice,
                         # But it failing in second time it will count as test failure.
                         if (exit_code == RERUN and trial == 1) or exit_code == FAIL or exit_code == SUCCESS:
@@ -642,19 +683,12 @@ class Linter:
                 1. DOCKERHUB_USER - User for docker hub.
                 2. DOCKERHUB_PASSWORD - Password for docker-hub.
             Used in Circle-CI for pushing into repo devtestdemisto
+            All linters share the same docker client, which is logged in once when created - reuse its status.
 
         Returns:
             bool: True if logged in successfully.
         """
-        docker_user = os.getenv('DOCKERHUB_USER')
-        docker_pass = os.getenv('DOCKERHUB_PASSWORD')
-        try:
-            self._docker_client.login(username=docker_user,
-                                      password=docker_pass,
-                                      registry="https://index.docker.io/v1")
-            return self._docker_client.ping()
-        except docker.errors.APIError:
-            return False
+        return bool(docker_helper.DOCKER_HUB_LOGIN)
 
     @timer(group_name='lint')
     def _docker_image_create(self, docker_base_image: List[Any]) -> Tuple[str, str]:
@@ -676,45 +710,41 @@ class Linter:
         requirements = []
 
         if docker_base_image[1] != -1:
-            py_ver = parse(docker_base_image[1]).major
-            if py_ver == 2:
-                requirements = self._req_2
-            elif py_ver == 3:
-                requirements = self._req_3
+            requirements = self._requirements_by_major.get(parse(docker_base_image[1]).major, [])
         # Using DockerFile template
         pip_requirements = requirements + self._facts["additional_requirements"]
         # Trying to pull image based on dockerfile hash, will check if something changed
         errors = ""
-        identifier = hashlib.md5("\n".join(sorted(pip_requirements)).encode("utf-8")).hexdigest()
-        test_image_name = f'devtest{docker_base_image[0]}-{identifier}'
+        test_image_name = get_test_image_name(docker_base_image[0], tuple(pip_requirements))
         test_image = None
-        try:
-            logger.info(f"{log_prompt} - Trying to pull existing image {test_image_name}")
-            test_image = Docker.pull_image(test_image_name)
-        except (docker.errors.APIError, docker.errors.ImageNotFound):
-            logger.info(f"{log_prompt} - Unable to find image {test_image_name}")
-        # Creatng new image if existing image isn't found
-        if not test_image:
-            logger.info(
-                f"{log_prompt} - Creating image based on {docker_base_image[0]} - Could take 2-3 minutes at first "
-                f"time")
+        with TEST_IMAGES_LOCKS.setdefault(test_image_name, threading.Lock()):
             try:
-                Docker.create_image(docker_base_image[0], test_image_name, container_type=self._pkg_lint_status["pack_type"],
-                                    install_packages=pip_requirements)
-
-                if self._docker_hub_login:
-                    for _ in range(2):
-                        try:
-                            self._docker_client.images.push(test_image_name)
-                            logger.info(f"{log_prompt} - Image {test_image_name} pushed to repository")
-                            break
-                        except (requests.exceptions.ConnectionError, urllib3.exceptions.ReadTimeoutError,
-                                requests.exceptions.ReadTimeout):
-                            logger.info(f"{log_prompt} - Unable to push image {test_image_name} to repository")
-
-            except (docker.errors.BuildError, docker.errors.APIError, Exception) as e:
-                logger.critical(f"{log_prompt} - Build errors occurred {e}")
-                errors = str(e)
+                logger.info(f"{log_prompt} - Trying to pull existing image {test_image_name}")
+                test_image = Docker.pull_image(test_image_name)
+            except (docker.errors.APIError, docker.errors.ImageNotFound):
+                logger.info(f"{log_prompt} - Unable to find image {test_image_name}")
+            # Creatng new image if existing image isn't found
+            if not test_image:
+                logger.info(
+                    f"{log_prompt} - Creating image based on {docker_base_image[0]} - Could take 2-3 minutes at first "
+                    f"time")
+                try:
+                    Docker.create_image(docker_base_image[0], test_image_name, container_type=self._pkg_lint_status["pack_type"],
+                                        install_packages=pip_requirements)
+
+                    if self._docker_hub_login:
+                        for _ in range(2):
+                            try:
+                                self._docker_client.images.push(test_image_name)
+                                logger.info(f"{log_prompt} - Image {test_image_name} pushed to repository")
+                                break
+                            except (requests.exceptions.ConnectionError, urllib3.exceptions.ReadTimeoutError,
+                                    requests.exceptions.ReadTimeout):
+                                logger.info(f"{log_prompt} - Unable to push image {test_image_name} to repository")
+
+                except (docker.errors.BuildError, docker.errors.APIError, Exception) as e:
+                    logger.critical(f"{log_prompt} - Build errors occurred {e}")
+                    errors = str(e)
         return test_image_name, errors
 
     def _docker_remove_container(self, container_name: str):
@@ -757,18 +787,18 @@ class Linter:
                     build_pylint_command(
                         self._facts["lint_files"], docker_version=self._facts.get('python_version'))
                 ],
-                user=f"{os.getuid()}:4000",
+                user=CONTAINER_USER,
                 files_to_push=[('/devwork', self._pack_abs_dir)],
                 environment=self._facts["env_vars"],
             )
             container.start()
-            stream_docker_container_output(container.logs(stream=True))
+            streamed_log = stream_docker_container_output(container.logs(stream=True))
             # wait for container to finish
             container_status = container.wait(condition="exited")
             # Get container exit code
             container_exit_code = container_status.get("StatusCode")
-            # Getting container logs
-            container_log = container.logs().decode("utf-8")
+            # Getting container logs, falling back to the daemon if streaming failed
+            container_log = (container.logs() if streamed_log is None else streamed_log).decode("utf-8")
             logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
             if container_exit_code in [1, 2]:
                 # 1-fatal message issued
@@ -828,15 +858,14 @@ class Linter:
         try:
             # Running pytest container
             cov = '' if no_coverage else self._pack_abs_dir.stem
-            uid = os.getuid() or 4000
-            logger.debug(f'{log_prompt} - user uid for running lint/test: {uid}')  # lgtm[py/clear-text-logging-sensitive-data]
+            logger.debug(f'{log_prompt} - user for running lint/test: {CONTAINER_USER}')  # lgtm[py/clear-text-logging-sensitive-data]
             container = Docker.create_container(
-                name=container_name, image=test_image, user=f"{uid}:4000",
+                name=container_name, image=test_image, user=CONTAINER_USER,
                 command=[build_pytest_command(test_xml=test_xml, json=True, cov=cov)],
                 environment=self._facts["env_vars"], files_to_push=[('/devwork', self._pack_abs_dir)]
             )
             container.start()
-            stream_docker_container_output(container.logs(stream=True))
+            streamed_log = stream_docker_container_output(container.logs(stream=True))
             # Waiting for container to be finished
             container_status: dict = container.wait(condition="exited")
             # Getting container exit code
@@ -849,19 +878,13 @@ class Linter:
                 # 2-Test execution was interrupted by the user
                 # 5-No tests were collected
                 if test_xml:
-                    test_data_xml = get_file_from_container(container_obj=container,
-                                                            container_path="/devwork/report_pytest.xml")
-                    xml_apth = Path(test_xml) / f'{self._pack_name}_pytest.xml'
-                    with open(file=xml_apth, mode='bw') as f:
-                        f.write(test_data_xml)  # type: ignore
+                    get_file_from_container(container_obj=container, container_path="/devwork/report_pytest.xml",
+                                            dest=Path(test_xml) / f'{self._pack_name}_pytest.xml')
 
                 if not no_coverage:
                     cov_file_path = os.path.join(self._pack_abs_dir, '.coverage')
-                    cov_data = get_file_from_container(container_obj=container,
-                                                       container_path="/devwork/.coverage")
-                    cov_data = cov_data if isinstance(cov_data, bytes) else cov_data.encode()
-                    with open(cov_file_path, 'wb') as coverage_file:
-                        coverage_file.write(cov_data)
+                    get_file_from_container(container_obj=container, container_path="/devwork/.coverage",
+                                            dest=Path(cov_file_path))
                     coverage_report_editor(cov_file_path, os.path.join(self._pack_abs_dir, f'{self._pack_abs_dir.stem}.py'))
 
                 test_json = json.loads(get_file_from_container(container_obj=container,
@@ -874,7 +897,7 @@ class Linter:
                     logger.info(f"{log_prompt} - Successfully finished")
                     exit_code = SUCCESS
                 elif container_exit_code in [2]:
-                    output = container.logs().decode('utf-8')
+                    output = (container.logs() if streamed_log is None else streamed_log).decode('utf-8')
                     exit_code = FAIL
                 else:
                     logger.error(f"{log_prompt} - Finished, errors found")
@@ -884,7 +907,7 @@ class Linter:
                 # 4-pytest command line usage error
                 logger.critical(f"{log_prompt} - Usage error")
                 exit_code = RERUN
-                output = container.logs().decode('utf-8')
+                output = (container.logs() if streamed_log is None else streamed_log).decode('utf-8')
             else:
                 # Any other container exit code
                 logger.error(f"{log_prompt} - Finished, docker container error found ({container_exit_code})")
@@ -930,22 +953,21 @@ class Linter:
         exit_code = SUCCESS
         output = ""
         try:
-            uid = os.getuid() or 4000
-            logger.debug(f'{log_prompt} - user uid for running lint/test: {uid}')  # lgtm[py/clear-text-logging-sensitive-data]
+            logger.debug(f'{log_prompt} - user for running lint/test: {CONTAINER_USER}')  # lgtm[py/clear-text-logging-sensitive-data]
             container = Docker.create_container(name=container_name, image=test_image,
-                                                user=f"{uid}:4000", environment=self._facts["env_vars"],
+                                                user=CONTAINER_USER, environment=self._facts["env_vars"],
                                                 files_to_push=[('/devwork', self._pack_abs_dir)],
                                                 command=build_pwsh_analyze_command(
                                                     self._facts["lint_files"][0])
                                                 )
             container.start()
-            stream_docker_container_output(container.logs(stream=True))
+            streamed_log = stream_docker_container_output(container.logs(stream=True))
             # wait for container to finish
             container_status = container.wait(condition="exited")
             # Get container exit code
             container_exit_code = container_status.get("StatusCode")
-            # Getting container logs
-            container_log = container.logs().decode("utf-8")
+            # Getting container logs, falling back to the daemon if streaming failed
+            container_log = (container.logs() if streamed_log is None else streamed_log).decode("utf-8")
             logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
             if container_exit_code:
                 # 1-fatal message issued
@@ -999,20 +1021,19 @@ class Linter:
         exit_code = SUCCESS
         output = ""
         try:
-            uid = os.getuid() or 4000
-            logger.debug(f'{log_prompt} - user uid for running lint/test: {uid}')  # lgtm[py/clear-text-logging-sensitive-data]
+            logger.debug(f'{log_prompt} - user for running lint/test: {CONTAINER_USER}')  # lgtm[py/clear-text-logging-sensitive-data]
             container: docker.models.containers.Container = Docker.create_container(
                 files_to_push=[('/devwork', self._pack_abs_dir)],
                 name=container_name, image=test_image, command=build_pwsh_test_command(),
-                user=f"{uid}:4000", environment=self._facts["env_vars"])
+                user=CONTAINER_USER, environment=self._facts["env_vars"])
             container.start()
-            stream_docker_container_output(container.logs(stream=True))
+            streamed_log = stream_docker_container_output(container.logs(stream=True))
             # wait for container to finish
             container_status = container.wait(condition="exited")
             # Get container exit code
             container_exit_code = container_status.get("StatusCode")
-            # Getting container logs
-            container_log = container.logs().decode("utf-8")
+            # Getting container logs, falling back to the daemon if streaming failed
+            container_log = (container.logs() if streamed_log is None else streamed_log).decode("utf-8")
             logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
             if container_exit_code:
                 # 1-fatal message issued
@@ -1,10 +1,15 @@
 import importlib
+import io
 import os
+import tarfile
+from pathlib import Path
 
 import pytest
+import requests
 
 from demisto_sdk.commands.lint.helpers import (generate_coverage_report,
-                                               split_warnings_errors)
+                                               split_warnings_errors,
+                                               stream_docker_container_output)
 
 
 def test_validate_env(mocker) -> None:
@@ -66,6 +71,30 @@ def test_get_python_version_from_image(image: str, output: bytes, expected: floa
     assert expected == helpers.get_python_version_from_image(image)
 
 
+def test_get_python_version_from_image_env(mocker):
+    from demisto_sdk.commands.lint import helpers
+    mocker.patch.object(helpers, 'init_global_docker_client')
+    docker_client = helpers.init_global_docker_client()
+    docker_client.images.get().attrs = {'Config': {'Env': ['PATH=/usr/local/bin', 'PYTHON_VERSION=3.10.4']}}
+    assert helpers.get_python_version_from_image('demisto/py-env-image:1.0.0.1') == '3.10'
+    docker_client.containers.run.assert_not_called()
+
+
+def test_get_python_version_from_image_null_config(mocker):
+    from demisto_sdk.commands.lint import helpers
+    mocker.patch.object(helpers, 'init_global_docker_client')
+    docker_client = helpers.init_global_docker_client()
+    docker_client.images.get().attrs = {'Config': None}
+    docker_client.containers.run().logs.return_value = b'3.7\n'
+    assert helpers.get_python_version_from_image('demisto/null-config-image:1.0.0.1') == '3.7'
+
+
+def test_get_python_version_from_image_no_docker_client(mocker):
+    from demisto_sdk.commands.lint import helpers
+    mocker.patch.object(helpers, 'init_global_docker_client', return_value=None)
+    assert helpers.get_python_version_from_image('demisto/no-client-image:1.0.0.1') == '3.8'
+
+
 def test_cache_of_get_python_version_from_image():
     """
     Given -
@@ -90,6 +119,65 @@ def test_cache_of_get_python_version_from_image():
     assert cache_info.hits == cache_info_before.hits + 1
 
 
+@pytest.mark.parametrize('encoding, expected', [('', b'report'), ('utf-8', 'report')])
+def test_get_file_from_container(mocker, encoding: str, expected):
+    from demisto_sdk.commands.lint import helpers
+    tar_bytes = io.BytesIO()
+    with tarfile.open(fileobj=tar_bytes, mode='w') as tar:
+        tar_info = tarfile.TarInfo('report_pytest.json')
+        tar_info.size = len(b'report')
+        tar.addfile(tar_info, io.BytesIO(b'report'))
+    archive = tar_bytes.getvalue()
+    mock_container = mocker.MagicMock()
+    # docker-sdk streams the archive in chunks
+    mock_container.get_archive.return_value = (iter([archive[:100], archive[100:]]), {'name': 'report_pytest.json'})
+    assert helpers.get_file_from_container(mock_container, '/devwork/report_pytest.json', encoding=encoding) == expected
+
+
+def test_get_file_from_container_to_dest(mocker, tmp_path):
+    from demisto_sdk.commands.lint import helpers
+    tar_bytes = io.BytesIO()
+    with tarfile.open(fileobj=tar_bytes, mode='w') as tar:
+        tar_info = tarfile.TarInfo('.coverage')
+        tar_info.size = len(b'coverage')
+        tar.addfile(tar_info, io.BytesIO(b'coverage'))
+    mock_container = mocker.MagicMock()
+    mock_container.get_archive.return_value = (iter([tar_bytes.getvalue()]), {'name': '.coverage'})
+    dest = tmp_path / '.coverage'
+    assert helpers.get_file_from_container(mock_container, '/devwork/.coverage', dest=dest) == b''
+    assert dest.read_bytes() == b'coverage'
+
+
+def test_get_file_from_container_to_dest_not_a_file(mocker, tmp_path):
+    from demisto_sdk.commands.lint import helpers
+    tar_bytes = io.BytesIO()
+    with tarfile.open(fileobj=tar_bytes, mode='w') as tar:
+        tar_info = tarfile.TarInfo('.coverage')
+        tar_info.type = tarfile.DIRTYPE
+        tar.addfile(tar_info)
+    mock_container = mocker.MagicMock()
+    mock_container.get_archive.return_value = (iter([tar_bytes.getvalue()]), {'name': '.coverage'})
+    dest = tmp_path / '.coverage'
+    with pytest.raises(IOError, match='not a regular file'):
+        helpers.get_file_from_container(mock_container, '/devwork/.coverage', dest=dest)
+    assert not dest.exists()
+
+
+@pytest.mark.parametrize('responses_ok, expected_calls', [([True], 1), ([False, True], 2), ([False, False], 2)])
+def test_get_test_modules_download_retry(mocker, responses_ok: list, expected_calls: int):
+    from demisto_sdk.commands.lint import helpers
+    mocker.patch.object(helpers.time, 'sleep')
+    get_mock = mocker.patch.object(helpers.requests, 'get')
+    get_mock.side_effect = [mocker.MagicMock(ok=ok, content=b'module') for ok in responses_ok] * 5
+    if all(not ok for ok in responses_ok):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            helpers.get_test_modules(content_repo=None, is_external_repo=False)
+    else:
+        modules = helpers.get_test_modules(content_repo=None, is_external_repo=False)
+        assert modules[Path('Tests/demistomock/demistomock.py')] == b'module'
+    assert get_mock.call_count == expected_calls * (5 if any(responses_ok) else 1)
+
+
 @pytest.mark.parametrize(argnames="archive_response, expected_count, expected_exception",
                          argvalues=[
                              ([False, True], 2, False),
@@ -156,10 +244,30 @@ MSG = [('flake8',
         [], [], ["Ebox.py:31:12: error: Incompatible return value type (got",
                  "Dict[Any, Any]', expected 'str')[return-value]     ", "return params^",
                  "    Found 1 error in 1 file (checked 1 source file)"]),
-
+       ('mypy',
+        "W\nE\n",
+        [], [], ["W", "E", ""]),
        ]
 
 
+@pytest.mark.parametrize('streamer, expected', [(iter([b'first\n', b'second\n']), b'first\nsecond\n'),
+                                                (iter([]), b''),
+                                                (iter([b'first\n', 'not bytes']), None),
+                                                (b'not a stream', None)])
+def test_stream_docker_container_output(streamer, expected):
+    """
+        Given:
+            - A docker logs stream.
+
+        When:
+            - Running stream_docker_container_output on it.
+
+        Then:
+            - Ensure the streamed output is returned, or None if streaming failed.
+    """
+    assert stream_docker_container_output(streamer) == expected
+
+
 @pytest.mark.parametrize('linter_name, input_msg, output_error, output_warning, output_other', MSG)
 def test_split_warnings_errors(linter_name, input_msg, output_error, output_warning, output_other):
     """
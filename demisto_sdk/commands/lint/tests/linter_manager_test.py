@@ -622,3 +622,93 @@ def test_create_json_output_xsoar_linter(repo, mocker):
         }
     ]
     assert json_contents == expected_format
+
+
+def test_get_all_packages_cached(tmp_path, mocker):
+    """
+    Given
+        - A content directory with an integration package and a script package.
+    When
+        - Scanning the directory for packages twice, and again with a new run after adding packages to a pack.
+    Then
+        - Ensure the packages are found, that the file system is scanned once per run,
+          and that the packages added to the pack are found by the new run.
+    """
+    from demisto_sdk.commands.lint import lint_manager
+    (tmp_path / 'Packs' / 'myPack' / 'Integrations' / 'INT1').mkdir(parents=True)
+    (tmp_path / 'Scripts' / 'Script1').mkdir(parents=True)
+    scan = mocker.spy(lint_manager, '_scan_packages')
+    manager = mock_lint_manager(mocker)
+
+    pkgs = manager._get_all_packages(content_dir=str(tmp_path))
+    assert sorted(pkg.name for pkg in pkgs) == ['INT1', 'Script1']
+    assert manager._get_all_packages(content_dir=str(tmp_path)) == pkgs
+    assert scan.call_count == 1
+
+    (tmp_path / 'Packs' / 'myPack' / 'Integrations' / 'INT2').mkdir(parents=True)
+    (tmp_path / 'Packs' / 'myPack' / 'Scripts' / 'Script2').mkdir(parents=True)
+    pkgs = mock_lint_manager(mocker)._get_all_packages(content_dir=str(tmp_path))
+    assert sorted(pkg.name for pkg in pkgs) == ['INT1', 'INT2', 'Script1', 'Script2']
+
+
+def test_filter_changed_packages(mocker):
+    """
+    Given
+        - Two packages, one of them has a changed file compared to the base commit.
+    When
+        - Filtering the changed packages twice.
+    Then
+        - Ensure the working tree is diffed against the base commit only once, and only the changed package is returned.
+    """
+    from wcmatch.pathlib import Path
+    lint_manager = mock_lint_manager(mocker)
+    content_repo = MagicMock(working_dir='/content')
+    content_repo.git.diff.return_value = 'Packs/myPack/Integrations/INT1/INT1.py\0Packs/myPack/README.md\0'
+    base_commit = '0' * 40
+    pkgs = [Path('/content/Packs/myPack/Integrations/INT1'), Path('/content/Packs/myPack/Integrations/INT2')]
+
+    for _ in range(2):
+        pkgs_to_check = lint_manager._filter_changed_packages(content_repo=content_repo, pkgs=pkgs,
+                                                              base_branch=base_commit)
+        assert pkgs_to_check == [Path('/content/Packs/myPack/Integrations/INT1')]
+    content_repo.git.diff.assert_called_once_with('--name-only', '-z', base_commit)
+
+
+def test_get_last_common_commit_cached(mocker):
+    """
+    Given
+        - Two repository objects of the same content repository.
+    When
+        - Getting the last common commit with a base branch using each of them.
+    Then
+        - Ensure the merge base is calculated once, and the cache is keyed on the repository working directory.
+    """
+    from demisto_sdk.commands.lint import lint_manager
+    mocker.patch.dict(lint_manager._LAST_COMMON_COMMITS, clear=True)
+    first_repo, second_repo = MagicMock(working_dir='/content'), MagicMock(working_dir='/content')
+    first_repo.merge_base.return_value = [MagicMock(hexsha='1' * 40)]
+
+    for content_repo in (first_repo, second_repo):
+        assert lint_manager._get_last_common_commit(content_repo, 'my-branch', '2' * 40, 'master') == '1' * 40
+    first_repo.merge_base.assert_called_once()
+    second_repo.merge_base.assert_not_called()
+    assert list(lint_manager._LAST_COMMON_COMMITS) == [('/content', 'my-branch', '2' * 40, 'master')]
+
+
+def test_add_pkg_to_checks_packs():
+    """
+    Given
+        - A package exit code with the flake8 and pylint checks failed, and a bit which is not a check exit code.
+    When
+        - Adding the package to the failed packages lists.
+    Then
+        - Ensure the package is added only to the flake8 and pylint lists.
+    """
+    from demisto_sdk.commands.lint.helpers import EXIT_CODES
+    packs_by_code = {code: [] for code in EXIT_CODES.values()}
+    code = EXIT_CODES['flake8'] | EXIT_CODES['pylint'] | 0b10000000000
+
+    LintManager._add_pkg_to_checks_packs(pkg='myPack', code=code, packs_by_code=packs_by_code)
+
+    assert {check for check, check_code in EXIT_CODES.items() if packs_by_code[check_code]} == {'flake8', 'pylint'}
+    assert packs_by_code[EXIT_CODES['flake8']] == ['myPack']
@@ -1,7 +1,11 @@
+import os
+from typing import List
+
 import pytest
+from wcmatch.pathlib import Path
 
 from demisto_sdk.commands.common.constants import TYPE_PWSH, TYPE_PYTHON
-from demisto_sdk.commands.lint import linter
+from demisto_sdk.commands.lint import docker_helper, linter
 from demisto_sdk.commands.lint.linter import Linter
 
 
@@ -40,6 +44,19 @@ class TestPylint:
         assert act_exit_code == exp_exit_code
         assert act_output == exp_output
 
+    def test_run_pylint_empty_streamed_log(self, mocker, linter_obj: Linter):
+        # Docker client mocking
+        mocker.patch('demisto_sdk.commands.lint.docker_helper.Docker.create_container')
+        container = linter.Docker.create_container()
+        container.wait.return_value = {"StatusCode": 0}
+        container.logs.side_effect = lambda stream=False: iter([]) if stream else b'test'
+        act_exit_code, act_output = linter_obj._docker_run_pylint(test_image='test-image',
+                                                                  keep_container=False)
+
+        assert act_exit_code == 0
+        assert act_output == ""
+        container.logs.assert_called_once_with(stream=True)
+
 
 class TestPytest:
     @pytest.mark.parametrize(argnames="exp_container_exit_code, exp_exit_code",
@@ -118,3 +135,39 @@ class TestRunLintInContainer:
             linter_obj._docker_run_pwsh_analyze.assert_called_once()
         elif not no_pwsh_test and pack_type == TYPE_PWSH:
             linter_obj._docker_run_pwsh_test.assert_called_once()
+
+
+def test_get_test_image_name_ignores_requirements_order():
+    first = linter.get_test_image_name('demisto/python3:3.8.6.12176', ('mock==4.0.2', 'pytest==6.1.1'))
+    second = linter.get_test_image_name('demisto/python3:3.8.6.12176', ('pytest==6.1.1', 'mock==4.0.2'))
+    assert first == second
+    assert first.startswith('devtestdemisto/python3:3.8.6.12176-')
+
+
+def create_linters_with_docker_client(mocker, env_vars: dict) -> List[Linter]:
+    mocker.patch.object(linter, 'docker')
+    mocker.patch.object(docker_helper, 'docker')
+    docker_helper.docker.from_env.return_value.ping.return_value = True
+    mocker.patch.object(docker_helper, 'DOCKER_CLIENT', None)
+    mocker.patch.object(docker_helper, 'DOCKER_HUB_LOGIN', None)
+    mocker.patch.dict(os.environ, env_vars)
+    docker_helper.init_global_docker_client()
+    return [Linter(pack_dir=Path(__file__).parent / 'content' / 'Integrations' / 'Sample_integration',
+                   content_repo=Path(__file__).parent / 'data',
+                   req_3=["pytest==3.0"],
+                   req_2=["pytest==2.0"],
+                   docker_engine=True,
+                   docker_timeout=60) for _ in range(2)]
+
+
+def test_docker_login_once(mocker):
+    linters = create_linters_with_docker_client(mocker, {'DOCKERHUB_USER': 'user', 'DOCKERHUB_PASSWORD': 'password'})
+    assert all(linter_obj._docker_hub_login for linter_obj in linters)
+    docker_helper.docker.from_env.assert_called_once_with(timeout=60)
+    docker_helper.DOCKER_CLIENT.login.assert_called_once()
+
+
+def test_docker_login_without_credentials(mocker):
+    linters = create_linters_with_docker_client(mocker, {'DOCKERHUB_USER': '', 'DOCKERHUB_PASSWORD': ''})
+    assert not any(linter_obj._docker_hub_login for linter_obj in linters)
+    docker_helper.DOCKER_CLIENT.login.assert_not_called()